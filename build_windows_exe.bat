@@ -6,7 +6,7 @@ python -m pip install --upgrade pip
 python -m pip install -r requirements.txt
 
 echo Building Windows executable...
-pyinstaller --noconfirm --clean --onefile --windowed --name MasterlistRendererGUI masterlist_gui.py
+pyinstaller --noconfirm --clean --onefile --windowed --hidden-import python_calamine --name MasterlistRendererGUI masterlist_gui.py
 
 echo.
 echo Build complete. EXE path:
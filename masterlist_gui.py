@@ -1,29 +1,215 @@
 import os
+import re
 import sys
+import time
 import queue
+import functools
+import collections
 import threading
-import subprocess
+import multiprocessing
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, colorchooser
 
-from render_masterlist import parse_rgb, run_render_process
-
+# render_masterlist (pandas, Pillow) is imported lazily inside the render
+# process so the window can appear without paying for those imports.
 
 DEFAULT_ROW_A_COLOR = "243,166,166"
 DEFAULT_ROW_B_COLOR = "232,126,126"
 DEFAULT_HEADER_BG_COLOR = "180,40,40"
 DEFAULT_BORDER_COLOR = "20,0,0"
 
+_RGB_RE = re.compile(r"\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\Z")
+
+
+def _quick_parse_rgb(value: str, field: str):
+    m = _RGB_RE.match(value)
+    if m is None:
+        raise ValueError(f"{field} must be R,G,B with values 0-255.")
+
+    rgb = tuple(int(g) for g in m.groups())
+    if any(c > 255 for c in rgb):
+        raise ValueError(f"{field} must be R,G,B with values 0-255.")
+
+    return rgb
+
+
+_DEFAULT_COLORS = {
+    "row_a_color": DEFAULT_ROW_A_COLOR,
+    "row_b_color": DEFAULT_ROW_B_COLOR,
+    "header_bg_color": DEFAULT_HEADER_BG_COLOR,
+    "border_color": DEFAULT_BORDER_COLOR,
+}
+_DEFAULT_COLOR_TUPLES = {
+    key: _quick_parse_rgb(value, key) for key, value in _DEFAULT_COLORS.items()
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_opener():
+    """
+    Returns a callable that opens a folder in the platform file manager,
+    preferring in-process APIs over spawning a helper program.
+    """
+    import subprocess
+
+    if sys.platform.startswith("win"):
+        startfile = getattr(os, "startfile", None)
+        if callable(startfile):
+            return startfile
+        return lambda path: subprocess.Popen(["explorer", path])
+
+    if sys.platform == "darwin":
+        try:
+            from AppKit import NSWorkspace
+            from Foundation import NSURL
+        except ImportError:
+            return lambda path: subprocess.Popen(["open", path])
+
+        workspace = NSWorkspace.sharedWorkspace()
+        return lambda path: workspace.openURL_(NSURL.fileURLWithPath_(path))
+
+    return lambda path: subprocess.Popen(["xdg-open", path])
+
+
+class _RenderCancelled(Exception):
+    pass
+
+
+def _render_entrypoint(options, reply_queue, cancel_event):
+    """
+    Runs one render job, reporting progress and the outcome on reply_queue.
+    Setting cancel_event stops the job after the page being saved.
+    """
+    try:
+        from render_masterlist import run_render_process
+    except ImportError as exc:
+        reply_queue.put(("error", f"Could not load the renderer: {exc}"))
+        return
+
+    try:
+        last_emit = [0.0]
+
+        def on_progress(page, total_pages):
+            if cancel_event.is_set():
+                raise _RenderCancelled()
+            # Cap progress traffic at ~20 Hz; the final page always goes out.
+            now = time.monotonic()
+            if now - last_emit[0] > 0.05 or page == total_pages:
+                last_emit[0] = now
+                reply_queue.put(("progress", page, total_pages))
+
+        pages, total_rows = run_render_process(
+            excel_path=options["excel_path"],
+            out_dir=options["out_dir"],
+            bg_path=options["bg_path"],
+            font_path=options["font_path"],
+            pairs=options["pairs"],
+            rows=options["rows"],
+            alpha=options["alpha"],
+            font_size=options["font_size"],
+            header_font_size=options["header_font_size"],
+            text_color=options["text_color"],
+            header_text_color=options["header_text_color"],
+            row_a_color=options["row_a_color"],
+            row_b_color=options["row_b_color"],
+            header_bg_color=options["header_bg_color"],
+            border_color=options["border_color"],
+            match_table_to_bg=options["match_table_to_bg"],
+            progress_callback=on_progress,
+        )
+        reply_queue.put(("done", pages, total_rows, options["out_dir"]))
+    except _RenderCancelled:
+        reply_queue.put(("error", "Rendering was cancelled."))
+    except Exception as exc:
+        reply_queue.put(("error", str(exc)))
+
+
+def _worker_loop(cmd_queue, reply_queue, cancel_event):
+    """
+    Long-lived render process: runs each queued job in turn so later renders
+    skip interpreter start-up and module imports. A None job shuts it down.
+    Lives at module level so the "spawn" start method (Windows, macOS) can
+    pickle it.
+    """
+    try:
+        while True:
+            options = cmd_queue.get()
+            if options is None:
+                break
+            _render_entrypoint(options, reply_queue, cancel_event)
+    finally:
+        # Stop the renderer's PNG save processes along with this one.
+        renderer = sys.modules.get("render_masterlist")
+        if renderer is not None:
+            renderer.shutdown_save_pool(cancel_futures=True)
+
 
 class MasterlistGuiApp:
+    # (option key, variable attribute, label, minimum, maximum or None)
+    _INT_FIELDS = (
+        ("pairs", "pairs_var", "Pairs per row", 1, None),
+        ("rows", "rows_var", "Rows per page", 1, None),
+        ("alpha", "alpha_var", "Cell alpha", 0, 255),
+        ("font_size", "font_size_var", "Body font size", 1, None),
+        ("header_font_size", "header_font_size_var", "Header font size", 1, None),
+    )
+    _INT_FIELD_KEYS = {attr: key for key, attr, *_ in _INT_FIELDS}
+
+    # (label, variable attribute, browse method name)
+    _PATH_FIELDS_META = (
+        ("Excel file", "excel_var", "_browse_excel"),
+        ("Output folder", "output_var", "_browse_output"),
+        ("Background image", "background_var", "_browse_background"),
+        ("Font (.ttf)", "font_var", "_browse_font"),
+    )
+
+    # (label, variable attribute), laid out two per row
+    _FIELDS_META = (
+        ("Pairs per row", "pairs_var"),
+        ("Rows per page", "rows_var"),
+        ("Cell alpha (0-255)", "alpha_var"),
+        ("Body font size", "font_size_var"),
+        ("Header font size", "header_font_size_var"),
+        ("Body text RGB", "text_color_var"),
+        ("Header text RGB", "header_text_color_var"),
+    )
+
+    # (label, variable attribute, color picker title, option key)
+    _COLOR_FIELDS_META = (
+        (
+            "Row A background",
+            "row_a_color_var",
+            "Choose Row A background color",
+            "row_a_color",
+        ),
+        (
+            "Row B background",
+            "row_b_color_var",
+            "Choose Row B background color",
+            "row_b_color",
+        ),
+        (
+            "Header background",
+            "header_bg_color_var",
+            "Choose Header background color",
+            "header_bg_color",
+        ),
+        ("Border color", "border_color_var", "Choose Border color", "border_color"),
+    )
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Masterlist Renderer")
         self.root.geometry("760x700")
         self.root.minsize(700, 640)
 
-        self.events = queue.Queue()
+        self.events = collections.deque()
         self.is_running = False
+        self.worker = None
+        self.cmd_queue = None
+        self.reply_queue = None
+        self.cancel_event = None
+        self._last_open_ts = 0.0
 
         self.excel_var = tk.StringVar()
         self.output_var = tk.StringVar(value=os.path.abspath("output"))
@@ -45,67 +231,59 @@ class MasterlistGuiApp:
 
         self.status_var = tk.StringVar(value="Ready.")
 
+        # Integer fields are parsed as they are typed (see _validate_int_field);
+        # None marks a field that is currently empty.
+        self._parsed = {
+            key: int(getattr(self, attr).get()) for key, attr, *_ in self._INT_FIELDS
+        }
+        self._int_entries = {}
+
         self._build_ui()
+        self.root.bind("<<RenderEvent>>", lambda e: self._poll_events())
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_ui(self):
         main = ttk.Frame(self.root, padding=14)
         main.pack(fill="both", expand=True)
 
+        self._build_basic_inputs(main)
+        self._build_advanced_options(main)
+        self._build_table_colors(main)
+        self._build_actions(main)
+        self._build_status(main)
+
+    def _build_basic_inputs(self, main):
         basic = ttk.LabelFrame(main, text="Main Inputs", padding=12)
         basic.pack(fill="x")
         basic.columnconfigure(1, weight=1)
 
-        self._path_field(
-            parent=basic,
-            row=0,
-            label="Excel file",
-            variable=self.excel_var,
-            browse_callback=self._browse_excel,
-        )
-        self._path_field(
-            parent=basic,
-            row=1,
-            label="Output folder",
-            variable=self.output_var,
-            browse_callback=self._browse_output,
-        )
-        self._path_field(
-            parent=basic,
-            row=2,
-            label="Background image",
-            variable=self.background_var,
-            browse_callback=self._browse_background,
-        )
-        self._path_field(
-            parent=basic,
-            row=3,
-            label="Font (.ttf)",
-            variable=self.font_var,
-            browse_callback=self._browse_font,
-        )
+        for row, (label, var_attr, browse_attr) in enumerate(self._PATH_FIELDS_META):
+            self._path_field(
+                parent=basic,
+                row=row,
+                label=label,
+                variable=getattr(self, var_attr),
+                browse_callback=getattr(self, browse_attr),
+            )
 
+    def _build_advanced_options(self, main):
         advanced = ttk.LabelFrame(main, text="Advanced Options", padding=12)
         advanced.pack(fill="x", pady=(12, 0))
 
-        fields = [
-            ("Pairs per row", self.pairs_var),
-            ("Rows per page", self.rows_var),
-            ("Cell alpha (0-255)", self.alpha_var),
-            ("Body font size", self.font_size_var),
-            ("Header font size", self.header_font_size_var),
-            ("Body text RGB", self.text_color_var),
-            ("Header text RGB", self.header_text_color_var),
-        ]
-
-        for idx, (label, var) in enumerate(fields):
+        vcmd = (self.root.register(self._validate_int_field), "%P", "%W")
+
+        for idx, (label, var_attr) in enumerate(self._FIELDS_META):
             r = idx // 2
             c = (idx % 2) * 2
             ttk.Label(advanced, text=label).grid(
                 row=r, column=c, sticky="w", padx=(0, 8), pady=4
             )
-            ttk.Entry(advanced, textvariable=var, width=22).grid(
-                row=r, column=c + 1, sticky="ew", pady=4
-            )
+            entry = ttk.Entry(advanced, textvariable=getattr(self, var_attr), width=22)
+            entry.grid(row=r, column=c + 1, sticky="ew", pady=4)
+
+            if var_attr in self._INT_FIELD_KEYS:
+                self._int_entries[str(entry)] = self._INT_FIELD_KEYS[var_attr]
+                entry.configure(validate="key", validatecommand=vcmd)
 
         advanced.columnconfigure(1, weight=1)
         advanced.columnconfigure(3, weight=1)
@@ -121,39 +299,23 @@ class MasterlistGuiApp:
             text="When both are used, custom table colors below take priority.",
         ).grid(row=5, column=0, columnspan=4, sticky="w", pady=(4, 0))
 
+    def _build_table_colors(self, main):
         table_colors = ttk.LabelFrame(main, text="Table Colors", padding=12)
         table_colors.pack(fill="x", pady=(12, 0))
         table_colors.columnconfigure(1, weight=1)
 
-        self._color_field(
-            parent=table_colors,
-            row=0,
-            label="Row A background",
-            variable=self.row_a_color_var,
-            picker_title="Choose Row A background color",
-        )
-        self._color_field(
-            parent=table_colors,
-            row=1,
-            label="Row B background",
-            variable=self.row_b_color_var,
-            picker_title="Choose Row B background color",
-        )
-        self._color_field(
-            parent=table_colors,
-            row=2,
-            label="Header background",
-            variable=self.header_bg_color_var,
-            picker_title="Choose Header background color",
-        )
-        self._color_field(
-            parent=table_colors,
-            row=3,
-            label="Border color",
-            variable=self.border_color_var,
-            picker_title="Choose Border color",
-        )
+        for row, (label, var_attr, picker_title, _) in enumerate(
+            self._COLOR_FIELDS_META
+        ):
+            self._color_field(
+                parent=table_colors,
+                row=row,
+                label=label,
+                variable=getattr(self, var_attr),
+                picker_title=picker_title,
+            )
 
+    def _build_actions(self, main):
         actions = ttk.Frame(main)
         actions.pack(fill="x", pady=(12, 0))
 
@@ -166,11 +328,23 @@ class MasterlistGuiApp:
             actions, text="Open Output Folder", command=self._open_output_folder
         ).pack(side="left", padx=(8, 0))
 
+    def _build_status(self, main):
         self.progress = ttk.Progressbar(main, mode="determinate", maximum=1, value=0)
         self.progress.pack(fill="x", pady=(12, 0))
 
         ttk.Label(main, textvariable=self.status_var).pack(anchor="w", pady=(8, 0))
 
+    def _validate_int_field(self, proposed, widget_name):
+        key = self._int_entries[widget_name]
+        if proposed == "":
+            self._parsed[key] = None
+            return True
+        if not (proposed.isascii() and proposed.isdigit()):
+            return False
+
+        self._parsed[key] = int(proposed)
+        return True
+
     def _path_field(self, parent, row, label, variable, browse_callback):
         ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w", pady=4)
         ttk.Entry(parent, textvariable=variable).grid(
@@ -194,7 +368,9 @@ class MasterlistGuiApp:
     def _pick_color(self, variable, title):
         initial_hex = None
         try:
-            initial_hex = self._rgb_to_hex(parse_rgb(variable.get().strip()))
+            initial_hex = self._rgb_to_hex(
+                _quick_parse_rgb(variable.get().strip(), title)
+            )
         except Exception:
             pass
 
@@ -261,81 +437,55 @@ class MasterlistGuiApp:
         if font_path and not os.path.isfile(font_path):
             raise ValueError("Selected font file does not exist.")
 
-        try:
-            pairs = int(self.pairs_var.get().strip())
-            rows = int(self.rows_var.get().strip())
-            alpha = int(self.alpha_var.get().strip())
-            font_size = int(self.font_size_var.get().strip())
-            header_font_size = int(self.header_font_size_var.get().strip())
-        except ValueError:
-            raise ValueError(
-                "Pairs, rows, alpha, and font sizes must be whole numbers."
-            )
-
-        if pairs <= 0:
-            raise ValueError("Pairs per row must be greater than 0.")
-        if rows <= 0:
-            raise ValueError("Rows per page must be greater than 0.")
-        if not (0 <= alpha <= 255):
-            raise ValueError("Cell alpha must be between 0 and 255.")
-        if font_size <= 0:
-            raise ValueError("Body font size must be greater than 0.")
-        if header_font_size <= 0:
-            raise ValueError("Header font size must be greater than 0.")
+        int_values = {}
+        for key, _, label, low, high in self._INT_FIELDS:
+            value = self._parsed[key]
+            if value is None:
+                raise ValueError(f"{label} must be a whole number.")
+            if high is None and value < low:
+                raise ValueError(f"{label} must be greater than {low - 1}.")
+            if high is not None and not (low <= value <= high):
+                raise ValueError(f"{label} must be between {low} and {high}.")
+            int_values[key] = value
 
         text_color = self.text_color_var.get().strip()
         header_text_color = self.header_text_color_var.get().strip()
-        row_a_color = self.row_a_color_var.get().strip()
-        row_b_color = self.row_b_color_var.get().strip()
-        header_bg_color = self.header_bg_color_var.get().strip()
-        border_color = self.border_color_var.get().strip()
-
-        parse_rgb(text_color)
-        parse_rgb(header_text_color)
-        row_a_color_tuple = parse_rgb(row_a_color)
-        row_b_color_tuple = parse_rgb(row_b_color)
-        header_bg_color_tuple = parse_rgb(header_bg_color)
-        border_color_tuple = parse_rgb(border_color)
-
-        default_row_a_tuple = parse_rgb(DEFAULT_ROW_A_COLOR)
-        default_row_b_tuple = parse_rgb(DEFAULT_ROW_B_COLOR)
-        default_header_bg_tuple = parse_rgb(DEFAULT_HEADER_BG_COLOR)
-        default_border_tuple = parse_rgb(DEFAULT_BORDER_COLOR)
-
-        custom_row_a_color = (
-            row_a_color if row_a_color_tuple != default_row_a_tuple else None
-        )
-        custom_row_b_color = (
-            row_b_color if row_b_color_tuple != default_row_b_tuple else None
-        )
-        custom_header_bg_color = (
-            header_bg_color
-            if header_bg_color_tuple != default_header_bg_tuple
-            else None
-        )
-        custom_border_color = (
-            border_color if border_color_tuple != default_border_tuple else None
-        )
+        _quick_parse_rgb(text_color, "Body text RGB")
+        _quick_parse_rgb(header_text_color, "Header text RGB")
 
         return {
             "excel_path": excel_path,
             "out_dir": output_path,
             "bg_path": bg_path,
             "font_path": font_path,
-            "pairs": pairs,
-            "rows": rows,
-            "alpha": alpha,
-            "font_size": font_size,
-            "header_font_size": header_font_size,
+            "pairs": int_values["pairs"],
+            "rows": int_values["rows"],
+            "alpha": int_values["alpha"],
+            "font_size": int_values["font_size"],
+            "header_font_size": int_values["header_font_size"],
             "text_color": text_color,
             "header_text_color": header_text_color,
-            "row_a_color": custom_row_a_color,
-            "row_b_color": custom_row_b_color,
-            "header_bg_color": custom_header_bg_color,
-            "border_color": custom_border_color,
             "match_table_to_bg": self.match_table_to_bg_var.get(),
+            **self._validate_table_colors(),
         }
 
+    def _validate_table_colors(self):
+        """
+        Returns the custom table colors, with None for any color left at its
+        default so the renderer can still auto-match it to the background.
+        """
+        custom_colors = {}
+        for label, var_attr, _, key in self._COLOR_FIELDS_META:
+            raw = getattr(self, var_attr).get().strip()
+            if raw == _DEFAULT_COLORS[key]:
+                custom_colors[key] = None
+                continue
+
+            rgb = _quick_parse_rgb(raw, label)
+            custom_colors[key] = raw if rgb != _DEFAULT_COLOR_TUPLES[key] else None
+
+        return custom_colors
+
     def _start_render(self):
         if self.is_running:
             return
@@ -351,55 +501,85 @@ class MasterlistGuiApp:
         self.progress.configure(maximum=1, value=0)
         self.status_var.set("Preparing to render...")
 
-        worker = threading.Thread(
-            target=self._render_worker, args=(options,), daemon=True
+        self._ensure_worker()
+        self.cmd_queue.put(options)
+
+        forwarder = threading.Thread(
+            target=self._forward_events,
+            args=(self.reply_queue, self.worker),
+            daemon=True,
         )
-        worker.start()
-        self.root.after(100, self._poll_events)
+        forwarder.start()
 
-    def _render_worker(self, options):
-        try:
+    def _ensure_worker(self):
+        if self.worker is not None and self.worker.is_alive():
+            return
 
-            def on_progress(page, total_pages):
-                self.events.put(("progress", page, total_pages))
-
-            pages, total_rows = run_render_process(
-                excel_path=options["excel_path"],
-                out_dir=options["out_dir"],
-                bg_path=options["bg_path"],
-                font_path=options["font_path"],
-                pairs=options["pairs"],
-                rows=options["rows"],
-                alpha=options["alpha"],
-                font_size=options["font_size"],
-                header_font_size=options["header_font_size"],
-                text_color=options["text_color"],
-                header_text_color=options["header_text_color"],
-                row_a_color=options["row_a_color"],
-                row_b_color=options["row_b_color"],
-                header_bg_color=options["header_bg_color"],
-                border_color=options["border_color"],
-                match_table_to_bg=options["match_table_to_bg"],
-                progress_callback=on_progress,
-            )
-            self.events.put(("done", pages, total_rows, options["out_dir"]))
-        except Exception as exc:
-            self.events.put(("error", str(exc)))
+        self.cmd_queue = multiprocessing.Queue()
+        self.reply_queue = multiprocessing.Queue()
+        self.cancel_event = multiprocessing.Event()
+        self.worker = multiprocessing.Process(
+            target=_worker_loop,
+            args=(self.cmd_queue, self.reply_queue, self.cancel_event),
+        )
+        self.worker.start()
 
-    def _poll_events(self):
+    def _forward_events(self, reply_queue, process):
+        # Runs on a helper thread in the GUI process: relays events from the
+        # worker process into self.events until the current job finishes.
         while True:
             try:
-                event = self.events.get_nowait()
+                event = reply_queue.get(timeout=0.5)
             except queue.Empty:
+                if process.is_alive():
+                    continue
+                try:
+                    event = reply_queue.get(timeout=0.5)
+                except queue.Empty:
+                    event = (
+                        "error",
+                        "Renderer process exited unexpectedly "
+                        f"(code {process.exitcode}).",
+                    )
+
+            self._post_event(event)
+            if event[0] in ("done", "error"):
                 break
 
+    def _post_event(self, event):
+        # Called from the forwarder thread: queue the payload, then wake the Tk
+        # main loop so _poll_events runs right away instead of on a timer.
+        self.events.append(event)
+        try:
+            self.root.event_generate("<<RenderEvent>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # The window was closed while rendering; nothing left to update.
+            pass
+
+    def _poll_events(self):
+        # Drain everything queued since the last tick, but only touch the
+        # widgets once: intermediate progress events are superseded anyway.
+        last_progress = None
+        terminal = None
+        while self.events:
+            event = self.events.popleft()
             kind = event[0]
             if kind == "progress":
                 _, page, total_pages = event
-                self.progress.configure(maximum=max(1, total_pages), value=page)
-                self.status_var.set(f"Rendering page {page}/{total_pages}...")
-            elif kind == "done":
-                _, pages, total_rows, out_dir = event
+                last_progress = (page, total_pages)
+            elif kind in ("done", "error"):
+                terminal = event
+                break
+
+        if last_progress is not None:
+            page, total_pages = last_progress
+            self.progress.configure(maximum=max(1, total_pages), value=page)
+            self.status_var.set(f"Rendering page {page}/{total_pages}...")
+
+        if terminal is not None:
+            kind = terminal[0]
+            if kind == "done":
+                _, pages, total_rows, out_dir = terminal
                 self.is_running = False
                 self.generate_button.configure(state="normal")
                 self.status_var.set(
@@ -409,15 +589,24 @@ class MasterlistGuiApp:
                     "Rendering complete",
                     f"Generated {pages} page(s) into:\n{out_dir}",
                 )
-            elif kind == "error":
-                _, message = event
+            else:
+                _, message = terminal
                 self.is_running = False
                 self.generate_button.configure(state="normal")
                 self.status_var.set("Failed.")
                 messagebox.showerror("Rendering failed", message)
 
-        if self.is_running:
-            self.root.after(100, self._poll_events)
+    def _on_close(self):
+        if self.worker is not None and self.worker.is_alive():
+            # Let the worker stop on its own so it can shut down its save
+            # pool; a running job is cancelled at the next finished page.
+            if self.is_running:
+                self.cancel_event.set()
+            self.cmd_queue.put(None)
+            self.worker.join(timeout=5 if self.is_running else 2)
+            if self.worker.is_alive():
+                self.worker.terminate()
+        self.root.destroy()
 
     def _open_output_folder(self):
         path = self.output_var.get().strip()
@@ -432,17 +621,13 @@ class MasterlistGuiApp:
             )
             return
 
+        now = time.monotonic()
+        if now - self._last_open_ts < 0.5:
+            return
+        self._last_open_ts = now
+
         try:
-            if sys.platform.startswith("win"):
-                startfile = getattr(os, "startfile", None)
-                if callable(startfile):
-                    startfile(path)
-                else:
-                    subprocess.Popen(["explorer", path])
-            elif sys.platform == "darwin":
-                subprocess.Popen(["open", path])
-            else:
-                subprocess.Popen(["xdg-open", path])
+            _resolve_opener()(path)
         except Exception as exc:
             messagebox.showerror("Open folder failed", str(exc))
 
@@ -454,4 +639,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for multiprocessing in the PyInstaller-built Windows executable.
+    multiprocessing.freeze_support()
     main()
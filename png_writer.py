@@ -0,0 +1,32 @@
+import os
+import threading
+import multiprocessing
+
+from PIL import Image
+
+# Runs inside the PNG save pool. Kept apart from render_masterlist so pool
+# processes only import Pillow, not pandas.
+
+
+def exit_with_parent():
+    """
+    Pool initializer: exits this process as soon as its parent is gone, so a
+    renderer that gets killed mid-job doesn't leave save processes behind.
+    """
+    parent = multiprocessing.parent_process()
+    if parent is None:
+        return
+
+    def watch():
+        parent.join()
+        os._exit(1)
+
+    threading.Thread(target=watch, daemon=True).start()
+
+
+def save_page_png(data: bytes, mode: str, size, out_path: str, compress_level: int = 1):
+    # rotate image 90° clockwise
+    img = Image.frombytes(mode, size, data).transpose(Image.Transpose.ROTATE_270)
+    # zlib level 1 (the default) is several times faster than level 9 for
+    # ~10-15% larger files, a good trade for pages that are regenerated on demand.
+    img.save(out_path, "PNG", compress_level=compress_level)
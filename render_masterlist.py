@@ -1,34 +1,77 @@
 import os
-import math
+import hashlib
 import platform
+import importlib.util
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 import pandas as pd
 from PIL import Image, ImageDraw, ImageFont, ImageStat
+from png_writer import exit_with_parent, save_page_png
+
+# python-calamine parses .xlsx in Rust, several times faster than openpyxl;
+# fall back to pandas' default engine when it isn't installed.
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
 
 
 def get_sheet_names(path: str):
-    xl = pd.ExcelFile(path)
-    return xl.sheet_names
+    with pd.ExcelFile(path, engine=_EXCEL_ENGINE) as xl:
+        return xl.sheet_names
 
 
-def load_rows_from_sheet(
-    path: str, sheet_name: str, company_col="COMPANY NAME", brn_col="COMPANY NO."
+def load_columns_from_sheet(
+    path: "str | pd.ExcelFile",
+    sheet_name: str,
+    company_col="COMPANY NAME",
+    brn_col="COMPANY NO.",
 ):
-    df = pd.read_excel(path, sheet_name=sheet_name)
+    """
+    Returns the cleaned (companies, brns) columns of one sheet as two object
+    arrays. ``path`` may be an open pd.ExcelFile so several sheets can share
+    one parse of the workbook.
+    """
+    wanted = (company_col, brn_col)
+    # An open ExcelFile already carries its engine.
+    engine = None if isinstance(path, pd.ExcelFile) else _EXCEL_ENGINE
+    # Only parse the two columns we render; headers are matched after strip().
+    df = pd.read_excel(
+        path,
+        sheet_name=sheet_name,
+        usecols=lambda c: str(c).strip() in wanted,
+        dtype=str,
+        engine=engine,
+    )
     df.columns = [c.strip() for c in df.columns]
 
     if company_col not in df.columns or brn_col not in df.columns:
+        found = [
+            str(c).strip()
+            for c in pd.read_excel(
+                path, sheet_name=sheet_name, nrows=0, engine=engine
+            ).columns
+        ]
         raise ValueError(
-            f"[Sheet: {sheet_name}] Expected columns '{company_col}' and '{brn_col}'. Found: {list(df.columns)}"
+            f"[Sheet: {sheet_name}] Expected columns '{company_col}' and '{brn_col}'. Found: {found}"
         )
 
     df = df[[company_col, brn_col]].dropna(how="all")
-    df[company_col] = df[company_col].astype(str).str.strip()
-    df[brn_col] = df[brn_col].astype(str).str.strip()
+    companies = df[company_col].astype(str).str.strip().to_numpy(dtype=object)
+    brns = df[brn_col].astype(str).str.strip().to_numpy(dtype=object)
+
+    return companies, brns
+
 
-    rows = list(df.itertuples(index=False, name=None))
+def load_rows_from_sheet(
+    path: "str | pd.ExcelFile",
+    sheet_name: str,
+    company_col="COMPANY NAME",
+    brn_col="COMPANY NO.",
+):
+    companies, brns = load_columns_from_sheet(path, sheet_name, company_col, brn_col)
     # return rows as list[(company, brn)]
-    return rows
+    return list(zip(companies, brns))
 
 
 def pick_default_font() -> str:
@@ -66,6 +109,11 @@ def pick_default_font_linux() -> str:
     return pick_default_font()
 
 
+@lru_cache(maxsize=8192)
+def _text_width(font: ImageFont.FreeTypeFont, text: str) -> float:
+    return font.getlength(text)
+
+
 def wrap_lines(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -76,22 +124,31 @@ def wrap_lines(
     """
     Wrap text into up to max_lines without changing font size.
     If too long, truncate last line with ellipsis.
+
+    Line widths are built up from cached per-word widths rather than
+    re-measuring every candidate line. ``draw`` is kept for API compatibility.
     """
     words = text.split()
     if not words:
         return [""]
 
+    space_w = _text_width(font, " ")
+
     lines = []
     line = ""
+    line_w = 0.0
 
     for w in words:
-        test = (line + " " + w).strip()
-        if draw.textlength(test, font=font) <= max_width:
-            line = test
+        w_w = _text_width(font, w)
+        test_w = line_w + space_w + w_w if line else w_w
+        if test_w <= max_width:
+            line = line + " " + w if line else w
+            line_w = test_w
         else:
             if line:
                 lines.append(line)
             line = w
+            line_w = w_w
 
     if line:
         lines.append(line)
@@ -101,7 +158,7 @@ def wrap_lines(
         lines = lines[:max_lines]
         last = lines[-1]
 
-        while last and draw.textlength(last + "…", font=font) > max_width:
+        while last and _text_width(font, last + "…") > max_width:
             last = last[:-1].rstrip()
 
         lines[-1] = (last + "…") if last else "…"
@@ -110,7 +167,7 @@ def wrap_lines(
 
 
 def _clamp_color(value: float) -> int:
-    return max(0, min(255, int(round(value))))
+    return 0 if value < 0 else 255 if value > 255 else int(value + 0.5)
 
 
 def _blend(color, target, ratio: float):
@@ -125,7 +182,9 @@ def _relative_luminance(color) -> float:
 def derive_table_palette_from_background(
     bg_image: Image.Image, cell_alpha: int, header_alpha: int = 235
 ):
-    rgb_img = bg_image.convert("RGB")
+    # ImageStat takes the mean from Image.histogram(), which runs in C; only the
+    # 3x256-bin reduction is Python, so there is nothing to vectorize here.
+    rgb_img = bg_image if bg_image.mode == "RGB" else bg_image.convert("RGB")
     stat = ImageStat.Stat(rgb_img)
     avg = tuple(_clamp_color(c) for c in stat.mean)
 
@@ -152,6 +211,118 @@ def derive_table_palette_from_background(
     }
 
 
+# Each cached background is a ~6 MB BMP; keep only the most recent few.
+_BG_CACHE_MAX_FILES = 8
+
+
+def _background_cache_dir() -> str:
+    if platform.system() == "Windows":
+        root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(root, "masterlist")
+
+
+def _prune_background_cache(cache_dir: str, keep: str, source_prefix: str):
+    """
+    Removes older entries for the same source image, then the least recently
+    used entries beyond _BG_CACHE_MAX_FILES.
+    """
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not (name.startswith("bg_") and name.endswith(".bmp")) or name == keep:
+            continue
+        entry = os.path.join(cache_dir, name)
+        try:
+            if name.startswith(source_prefix):
+                os.unlink(entry)
+            else:
+                entries.append((os.stat(entry).st_mtime, entry))
+        except OSError:
+            pass
+
+    entries.sort(reverse=True)
+    for _, entry in entries[_BG_CACHE_MAX_FILES - 1 :]:
+        try:
+            os.unlink(entry)
+        except OSError:
+            pass
+
+
+def load_background(path: str, size) -> Image.Image:
+    """
+    Returns the background at path converted to RGB and resized to size.
+
+    The resized image is cached on disk as an uncompressed BMP, keyed on the
+    file's path, mtime and byte size, so later runs skip the decode and
+    resample. Only the newest entry per source path is kept, and at most
+    _BG_CACHE_MAX_FILES overall. Any cache I/O failure falls back to decoding
+    the original.
+    """
+    st = os.stat(path)
+    abs_path = os.path.abspath(path)
+    path_digest = hashlib.sha1(abs_path.encode("utf-8")).hexdigest()[:16]
+    key = f"{abs_path}|{st.st_mtime_ns}|{st.st_size}|{size[0]}x{size[1]}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    cache_dir = _background_cache_dir()
+    cache_name = f"bg_{path_digest}_{digest}_{size[0]}x{size[1]}.bmp"
+    cache_path = os.path.join(cache_dir, cache_name)
+
+    try:
+        with Image.open(cache_path) as cached:
+            cached.load()
+            if cached.mode == "RGB" and cached.size == tuple(size):
+                # Mark as recently used so pruning keeps it.
+                os.utime(cache_path)
+                return cached.copy()
+    except (OSError, ValueError):
+        pass
+
+    source = Image.open(path)
+    if source.mode != "RGB":
+        source = source.convert("RGB")
+    resized = source.resize(size)
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        resized.save(tmp_path, "BMP")
+        os.replace(tmp_path, cache_path)
+        _prune_background_cache(cache_dir, cache_name, f"bg_{path_digest}_")
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+    return resized
+
+
+_SAVE_WORKERS = os.cpu_count() or 1
+_save_pool = None
+
+
+def get_save_pool() -> ProcessPoolExecutor:
+    """
+    Returns the process pool that encodes pages, creating it on first use.
+    The pool is kept for the life of the process, so repeated renders (e.g.
+    from the GUI's long-lived worker) don't start new save processes each time.
+    """
+    global _save_pool
+    if _save_pool is None:
+        _save_pool = ProcessPoolExecutor(
+            max_workers=_SAVE_WORKERS, initializer=exit_with_parent
+        )
+    return _save_pool
+
+
+def shutdown_save_pool(cancel_futures: bool = False):
+    global _save_pool
+    if _save_pool is not None:
+        _save_pool.shutdown(wait=True, cancel_futures=cancel_futures)
+        _save_pool = None
+
+
 def render_streamed_pages(
     rows_stream,
     total_rows: int,
@@ -179,6 +350,7 @@ def render_streamed_pages(
     match_table_to_bg: bool = False,
     allow_auto_body_text: bool = True,
     allow_auto_header_text: bool = True,
+    compress_level: int = 1,
     progress_callback=None,
 ):
     """
@@ -191,15 +363,15 @@ def render_streamed_pages(
         font_path = pick_default_font()
 
     header_font = ImageFont.truetype(font_path, header_font_size)
-    company_font = ImageFont.truetype(font_path, body_font_size)
-    brn_font = ImageFont.truetype(font_path, body_font_size)
+    # Both body columns share one font, so they also share _text_width entries.
+    body_font = ImageFont.truetype(font_path, body_font_size)
+    company_font = brn_font = body_font
 
     # Background
     if background_path and os.path.exists(background_path):
-        base_bg = Image.open(background_path).convert("RGB").resize((width, height))
+        base_bg = load_background(background_path, (width, height))
     else:
         base_bg = Image.new("RGB", (width, height), (255, 255, 255))
-    base_bg = base_bg.convert("RGBA")
 
     usable_w = width - 2 * margin
     usable_h = height - 2 * margin
@@ -223,7 +395,7 @@ def render_streamed_pages(
         y += h
 
     per_page = pairs_per_row * rows_per_page
-    total_pages = math.ceil(total_rows / per_page)
+    total_pages = (total_rows + per_page - 1) // per_page
 
     # Colors
     base_row_a = row_a_color or (243, 166, 166)
@@ -264,123 +436,201 @@ def render_streamed_pages(
     row_b = palette["row_b"]
     header_bg = palette["header_bg"]
     border = palette["border"]
-    text = (*palette["body_text"], 255)
-    header_text = (*palette["header_text"], 255)
-
-    def header_rect(pair_i, is_brn: bool):
-        x0 = margin + pair_i * (pair_w + gutter) + (name_w if is_brn else 0)
-        x1 = x0 + (brn_w if is_brn else name_w)
-        y0 = margin
-        y1 = margin + header_h
-        return x0, y0, x1, y1
-
-    def cell_rect(pair_i, row_i, is_brn: bool):
-        x0 = margin + pair_i * (pair_w + gutter) + (name_w if is_brn else 0)
-        x1 = x0 + (brn_w if is_brn else name_w)
-
-        y0 = row_tops[row_i]
-        y1 = y0 + row_heights[row_i]
-
-        return x0, y0, x1, y1
-
-    # Consume the stream page-by-page
-    for page in range(1, total_pages + 1):
-        img = base_bg.copy()  # RGBA
-
-        overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-        odraw = ImageDraw.Draw(overlay)
-
-        # Header blocks
-        for p in range(pairs_per_row):
-            for is_brn, label in [(False, "COMPANY NAME"), (True, "BRN NO")]:
-                x0, y0, x1, y1 = header_rect(p, is_brn)
-                odraw.rectangle(
-                    [x0, y0, x1, y1], fill=header_bg, outline=border, width=border_width
-                )
-
-        # Pull exactly per_page rows from the stream (or less on last page)
-        page_rows = []
-        for _ in range(per_page):
-            try:
-                page_rows.append(next(rows_stream))
-            except StopIteration:
-                break
-
-        # Draw body rectangles first (translucent)
-        for i, (company, brn) in enumerate(page_rows):
-            row_i = i // pairs_per_row
-            pair_i = i % pairs_per_row
-            bg = row_a if (row_i % 2 == 0) else row_b
+    text = tuple(palette["body_text"])
+    header_text = tuple(palette["header_text"])
+
+    # Cell edges, indexed by pair (x) and row (y), computed once per job
+    name_x0 = [margin + p * (pair_w + gutter) for p in range(pairs_per_row)]
+    name_x1 = [x + name_w for x in name_x0]
+    brn_x0 = name_x1
+    brn_x1 = [x + brn_w for x in brn_x0]
+    row_bottoms = [top + h for top, h in zip(row_tops, row_heights)]
+
+    header_boxes = []
+    for p in range(pairs_per_row):
+        header_boxes.append(
+            ((name_x0[p], margin, name_x1[p], margin + header_h), "COMPANY NAME")
+        )
+        header_boxes.append(
+            ((brn_x0[p], margin, brn_x1[p], margin + header_h), "BRN NO")
+        )
 
-            x0, y0, x1, y1 = cell_rect(pair_i, row_i, is_brn=False)
-            xb0, yb0, xb1, yb1 = cell_rect(pair_i, row_i, is_brn=True)
+    # Each body row is the same run of cells, differing only by stripe color
+    # and height, so draw each variant once as an RGBA strip and paste it.
+    strip_x = name_x0[0]
+    strip_w = brn_x1[-1] - strip_x + 1
+    strips = {}
 
+    def row_strip(row_i: int):
+        key = (row_i % 2, row_heights[row_i])
+        strip = strips.get(key)
+        if strip is None:
+            bg = row_a if (row_i % 2 == 0) else row_b
+            # +1: rectangle bounds are inclusive, so the bottom border sits on
+            # the next row's top edge, exactly as when drawn in place.
+            strip_h = row_heights[row_i] + 1
+            strip = Image.new("RGBA", (strip_w, strip_h), (0, 0, 0, 0))
+            sdraw = ImageDraw.Draw(strip)
+            for p in range(pairs_per_row):
+                for x0, x1 in ((name_x0[p], name_x1[p]), (brn_x0[p], brn_x1[p])):
+                    sdraw.rectangle(
+                        (x0 - strip_x, 0, x1 - strip_x, strip_h - 1),
+                        fill=bg,
+                        outline=border,
+                        width=border_width,
+                    )
+            strips[key] = strip
+        return strip
+
+    def render_chrome(cell_count: int):
+        """
+        Background, header blocks + labels and the empty body cells for the
+        first cell_count slots: everything on a page except the row text.
+        """
+        img = base_bg.copy()  # RGB
+
+        # An "RGBA" draw on an RGB image alpha-blends each fill straight into
+        # the background, so no overlay layer or alpha_composite is needed.
+        odraw = ImageDraw.Draw(img, "RGBA")
+
+        # Header blocks + labels in one pass
+        th = header_font.size
+        for (x0, y0, x1, y1), label in header_boxes:
             odraw.rectangle(
-                [x0, y0, x1, y1], fill=bg, outline=border, width=border_width
+                (x0, y0, x1, y1), fill=header_bg, outline=border, width=border_width
             )
-            odraw.rectangle(
-                [xb0, yb0, xb1, yb1], fill=bg, outline=border, width=border_width
+            tw = _text_width(header_font, label)
+            odraw.text(
+                (x0 + (x1 - x0 - tw) / 2, y0 + (y1 - y0 - th) / 2),
+                label,
+                font=header_font,
+                fill=header_text,
             )
 
-        img = Image.alpha_composite(img, overlay)
-        draw = ImageDraw.Draw(img)
-
-        # Header text
-        for p in range(pairs_per_row):
-            for is_brn, label in [(False, "COMPANY NAME"), (True, "BRN NO")]:
-                x0, y0, x1, y1 = header_rect(p, is_brn)
-                tw = draw.textlength(label, font=header_font)
-                th = header_font.size
-                draw.text(
-                    (x0 + (x1 - x0 - tw) / 2, y0 + (y1 - y0 - th) / 2),
-                    label,
-                    font=header_font,
-                    fill=header_text,
+        # Body rectangles (translucent), one pasted strip per row
+        full_rows, partial = divmod(cell_count, pairs_per_row)
+        for row_i in range(full_rows + (1 if partial else 0)):
+            strip = row_strip(row_i)
+            if row_i == full_rows:
+                # Last, partially filled row: keep only its first cells.
+                strip = strip.crop(
+                    (0, 0, brn_x1[partial - 1] - strip_x + 1, strip.height)
                 )
+            img.paste(strip, (strip_x, row_tops[row_i]), strip)
+
+        return img
+
+    # Per-cell text layout constants
+    pad = 10
+    line_gap = 2
+    company_step = company_font.size + line_gap
+    brn_size = brn_font.size
+    company_wrap_w = name_w - 2 * pad
+    brn_wrap_w = brn_w - 2 * pad
+
+    # Vertical text positions only depend on the row (and, for the company
+    # column, on how many lines it wrapped to), so compute them once per job.
+    company_y = []
+    brn_y = []
+    for y0, y1 in zip(row_tops, row_bottoms):
+        company_y.append(
+            [y0 + ((y1 - y0) - (n * company_step - line_gap)) / 2 for n in range(3)]
+        )
+        brn_y.append(y0 + ((y1 - y0) - brn_size) / 2)
 
-        # Body text (solid)
-        pad = 10
-        for i, (company, brn) in enumerate(page_rows):
-            row_i = i // pairs_per_row
-            pair_i = i % pairs_per_row
+    # The chrome is identical on every full page, so render it once.
+    page_template = render_chrome(per_page)
 
-            x0, y0, x1, y1 = cell_rect(pair_i, row_i, is_brn=False)
-            xb0, yb0, xb1, yb1 = cell_rect(pair_i, row_i, is_brn=True)
+    # Pages are saved in worker processes; progress is reported as each save
+    # completes, in page order.
+    pool = get_save_pool()
+    pending = deque()
 
-            company_lines = wrap_lines(
-                draw, company, company_font, (x1 - x0 - 2 * pad), 2
-            )
-            brn_lines = wrap_lines(draw, brn, brn_font, (xb1 - xb0 - 2 * pad), 1)
-            brn_line = brn_lines[0] if brn_lines else brn
-
-            # Center company
-            line_gap = 2
-            total_h = len(company_lines) * (company_font.size + line_gap) - line_gap
-            cy = y0 + ((y1 - y0) - total_h) / 2
-            for line in company_lines:
-                tw = draw.textlength(line, font=company_font)
+    def finish_oldest():
+        done_page, future = pending.popleft()
+        future.result()
+        if callable(progress_callback):
+            progress_callback(done_page, total_pages)
+
+    try:
+        # Consume the stream page-by-page
+        for page in range(1, total_pages + 1):
+            # Pull exactly per_page rows from the stream (or less on last page)
+            page_rows = []
+            for _ in range(per_page):
+                try:
+                    page_rows.append(next(rows_stream))
+                except StopIteration:
+                    break
+
+            if len(page_rows) == per_page:
+                img = page_template.copy()
+            else:
+                # Short last page: only draw cells for the rows it actually has.
+                img = render_chrome(len(page_rows))
+            draw = ImageDraw.Draw(img)
+
+            # Body text (solid)
+            for i, (company, brn) in enumerate(page_rows):
+                row_i = i // pairs_per_row
+                pair_i = i % pairs_per_row
+
+                x0 = name_x0[pair_i]
+                xb0 = brn_x0[pair_i]
+
+                company_lines = wrap_lines(
+                    draw, company, company_font, company_wrap_w, 2
+                )
+                brn_lines = wrap_lines(draw, brn, brn_font, brn_wrap_w, 1)
+                brn_line = brn_lines[0] if brn_lines else brn
+
+                # Center company
+                cy = company_y[row_i][len(company_lines)]
+                for line in company_lines:
+                    tw = _text_width(company_font, line)
+                    draw.text(
+                        (x0 + (name_w - tw) / 2, cy),
+                        line,
+                        font=company_font,
+                        fill=text,
+                    )
+                    cy += company_step
+
+                # Center BRN
+                tw = _text_width(brn_font, brn_line)
                 draw.text(
-                    (x0 + (x1 - x0 - tw) / 2, cy), line, font=company_font, fill=text
+                    (xb0 + (brn_w - tw) / 2, brn_y[row_i]),
+                    brn_line,
+                    font=brn_font,
+                    fill=text,
                 )
-                cy += company_font.size + line_gap
-
-            # Center BRN
-            tw = draw.textlength(brn_line, font=brn_font)
-            draw.text(
-                (xb0 + (xb1 - xb0 - tw) / 2, yb0 + ((yb1 - yb0) - brn_font.size) / 2),
-                brn_line,
-                font=brn_font,
-                fill=text,
-            )
 
-        out_path = os.path.join(out_dir, f"masterlist_{page:02d}.png")
-        # rotate image 90° clockwise
-        rotated = img.transpose(Image.Transpose.ROTATE_270)
-
-        rotated.convert("RGB").save(out_path, "PNG", optimize=True)
-
-        if callable(progress_callback):
-            progress_callback(page, total_pages)
+            out_path = os.path.join(out_dir, f"masterlist_{page:02d}.png")
+
+            # Rotating and PNG encoding are the slowest steps per page; hand
+            # them to the pool so the next page can be drawn meanwhile.
+            future = pool.submit(
+                save_page_png,
+                img.tobytes(),
+                img.mode,
+                img.size,
+                out_path,
+                compress_level,
+            )
+            pending.append((page, future))
+            if len(pending) > _SAVE_WORKERS:
+                finish_oldest()
+
+        while pending:
+            finish_oldest()
+    except BaseException as exc:
+        # Failed or cancelled: drop the saves that haven't started yet.
+        for _, future in pending:
+            future.cancel()
+        if isinstance(exc, BrokenProcessPool):
+            # A save process died; start a fresh pool on the next job.
+            shutdown_save_pool()
+        raise
 
     return total_pages
 
@@ -402,14 +652,27 @@ def parse_rgb(value: str):
         )
 
 
-def load_all_rows(path: str):
-    sheet_names = get_sheet_names(path)
-    all_rows = []
+def load_all_columns(path: str):
+    """
+    Returns one (companies, brns) array pair per sheet, in sheet order.
+    """
+    # Open the workbook once; read_excel(path) per sheet would re-open and
+    # re-parse the whole file for every sheet.
+    with pd.ExcelFile(path, engine=_EXCEL_ENGINE) as xl:
+        return [load_columns_from_sheet(xl, sheet) for sheet in xl.sheet_names]
+
+
+def iter_rows(sheet_columns):
+    """
+    Yields (company, brn) tuples lazily, so the renderer never holds more
+    than a page of row tuples at a time.
+    """
+    for companies, brns in sheet_columns:
+        yield from zip(companies, brns)
 
-    for sheet in sheet_names:
-        all_rows.extend(load_rows_from_sheet(path, sheet_name=sheet))
 
-    return all_rows
+def load_all_rows(path: str):
+    return list(iter_rows(load_all_columns(path)))
 
 
 def run_render_process(
@@ -429,13 +692,14 @@ def run_render_process(
     header_bg_color: str | None = None,
     border_color: str | None = None,
     match_table_to_bg: bool = False,
+    compress_level: int = 1,
     progress_callback=None,
 ):
     default_text_color = "20,0,0"
     default_header_text_color = "255,255,255"
 
-    all_rows = load_all_rows(excel_path)
-    total_rows = len(all_rows)
+    sheet_columns = load_all_columns(excel_path)
+    total_rows = sum(len(companies) for companies, _ in sheet_columns)
 
     body_text_color = parse_rgb(text_color)
     header_text_color_value = parse_rgb(header_text_color)
@@ -446,12 +710,8 @@ def run_render_process(
     text_color_overridden = text_color != default_text_color
     header_text_color_overridden = header_text_color != default_header_text_color
 
-    def row_generator():
-        for row in all_rows:
-            yield row
-
     pages = render_streamed_pages(
-        rows_stream=row_generator(),
+        rows_stream=iter_rows(sheet_columns),
         total_rows=total_rows,
         out_dir=out_dir,
         width=1080,
@@ -477,6 +737,7 @@ def run_render_process(
         match_table_to_bg=match_table_to_bg,
         allow_auto_body_text=not text_color_overridden,
         allow_auto_header_text=not header_text_color_overridden,
+        compress_level=compress_level,
         progress_callback=progress_callback,
     )
 
@@ -511,22 +772,33 @@ def main():
         action="store_true",
         help="Automatically derive table and text colors from the background image",
     )
+    ap.add_argument(
+        "--compress_level",
+        type=int,
+        default=1,
+        choices=range(10),
+        help="PNG zlib level 0-9 (higher is smaller but slower)",
+    )
     args = ap.parse_args()
 
-    pages, _ = run_render_process(
-        excel_path=args.excel,
-        out_dir=args.out,
-        bg_path=args.bg,
-        font_path=args.font,
-        pairs=args.pairs,
-        rows=args.rows,
-        alpha=args.alpha,
-        font_size=args.font_size,
-        header_font_size=args.header_font_size,
-        text_color=args.text_color,
-        header_text_color=args.header_text_color,
-        match_table_to_bg=args.match_table_to_bg,
-    )
+    try:
+        pages, _ = run_render_process(
+            excel_path=args.excel,
+            out_dir=args.out,
+            bg_path=args.bg,
+            font_path=args.font,
+            pairs=args.pairs,
+            rows=args.rows,
+            alpha=args.alpha,
+            font_size=args.font_size,
+            header_font_size=args.header_font_size,
+            text_color=args.text_color,
+            header_text_color=args.header_text_color,
+            match_table_to_bg=args.match_table_to_bg,
+            compress_level=args.compress_level,
+        )
+    finally:
+        shutdown_save_pool()
 
     print(f"Done. Generated {pages} page(s) into: {args.out}")
 